@@ -20,14 +20,13 @@ def register_user(user: UserCreate, db: Session = Depends(get_db)):
         User: The created user object.
 
     Raises:
-        HTTPException: If the username is already registered (status code 400).
+        HTTPException: If the username or email is already registered (status code 400).
     """
-    # Check if the username is already taken
-    db_user = get_user_by_username(db, user.username)
-    if db_user:
-        raise HTTPException(status_code=400, detail="Username already registered")
-    # Create and save the new user
-    return create_user(db, user)
+    # Create and save the new user; None means the username or email is taken
+    db_user = create_user(db, user)
+    if db_user is None:
+        raise HTTPException(status_code=400, detail="Username or email already registered")
+    return db_user
 
 @router.post("/login")
 def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
@@ -1,3 +1,4 @@
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.models.post import Post
 from app.schemas.post import PostCreate
@@ -16,11 +17,19 @@ def create_post(db: Session, post: PostCreate, user_id: int):
     Raises:
         Exception: If database operations fail (e.g., integrity errors).
     """
-    # Create a new post instance with provided data and user ID
-    db_post = Post(**post.dict(), author_id=user_id)
-    db.add(db_post)
+    values = {**post.dict(), "author_id": user_id}
+    if db.get_bind().dialect.insert_returning:
+        # Insert the post and read back generated columns in a single statement
+        db_post = db.scalars(insert(Post).values(**values).returning(Post)).one()
+    else:
+        # Without RETURNING, flush and reload the row as the database stored it
+        db_post = Post(**values)
+        db.add(db_post)
+        db.flush()
+        db.refresh(db_post)
+    # Detach before commit so the inserted values are not expired and reloaded
+    db.expunge(db_post)
     db.commit()
-    db.refresh(db_post)
     return db_post
 
 def get_posts(db: Session, skip: int = 0, limit: int = 10):
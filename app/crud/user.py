@@ -1,8 +1,91 @@
+from sqlalchemy import select, text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.models.user import User
 from app.schemas.user import UserCreate
 from app.dependencies.auth import get_password_hash
 
+# Dialects that support INSERT ... ON CONFLICT DO NOTHING RETURNING
+_UPSERT_DIALECTS = {"postgresql", "sqlite"}
+
+# Columns written on insert; the primary key is generated by the database
+_INSERT_COLUMNS = [column for column in User.__table__.c if not column.primary_key]
+
+# Written as text because the dialect insert() constructs are not cached by
+# SQLAlchemy 2.0 and would be recompiled on every registration
+_UPSERT_USER = select(User).from_statement(
+    text(
+        f"INSERT INTO {User.__tablename__} ({', '.join(column.name for column in _INSERT_COLUMNS)}) "
+        f"VALUES ({', '.join(':' + column.key for column in _INSERT_COLUMNS)}) "
+        "ON CONFLICT DO NOTHING "
+        f"RETURNING {', '.join(column.name for column in User.__table__.c)}"
+    ).columns(*User.__table__.c)
+)
+
+# Names a driver may use for the unique username/email constraints in its error message
+_UNIQUE_NAMES = tuple(
+    name
+    for index in User.__table__.indexes if index.unique
+    for name in (index.name, *(f"{User.__tablename__}.{column.name}" for column in index.columns))
+)
+
+def _is_unique_violation(error: IntegrityError):
+    """Checks whether an integrity error comes from the username or email constraint.
+
+    Args:
+        error (IntegrityError): The error raised by the database driver.
+
+    Returns:
+        bool: True if a unique username/email constraint failed, False otherwise.
+    """
+    # Match the constraint or column name reported by the driver
+    message = str(error.orig)
+    return any(name in message for name in _UNIQUE_NAMES)
+
+def insert_user(db: Session, username: str, email: str, hashed_password: str):
+    """Inserts a user row with an already hashed password.
+
+    On PostgreSQL and SQLite builds that support RETURNING this is a single
+    INSERT ... ON CONFLICT DO NOTHING RETURNING statement, so a taken username
+    or email is detected by the database itself instead of a separate lookup.
+    Elsewhere the user is added and flushed, and a unique constraint violation
+    is treated as a conflict.
+
+    Args:
+        db (Session): Database session for transaction management.
+        username (str): The username of the new user.
+        email (str): The email address of the new user.
+        hashed_password (str): The hashed password of the new user.
+
+    Returns:
+        User: The created user object, or None if the username or email is already taken.
+
+    Raises:
+        Exception: If database operations fail for any other reason.
+    """
+    values = {"username": username, "email": email, "hashed_password": hashed_password}
+    dialect = db.get_bind().dialect
+    # Old SQLite builds (and PyPy) have ON CONFLICT but no RETURNING
+    if dialect.name in _UPSERT_DIALECTS and dialect.insert_returning:
+        # Insert the user, skipping the row if any unique constraint conflicts
+        db_user = db.scalars(_UPSERT_USER, values).one_or_none()
+    else:
+        # Elsewhere the conflict is reported as an IntegrityError
+        db_user = User(**values)
+        db.add(db_user)
+        try:
+            db.flush()
+        except IntegrityError as error:
+            db.rollback()
+            if _is_unique_violation(error):
+                return None
+            raise
+    if db_user is not None:
+        # Detach before commit so the inserted values are not expired and reloaded
+        db.expunge(db_user)
+    db.commit()
+    return db_user
+
 def create_user(db: Session, user: UserCreate):
     """Creates a new user in the database with hashed password.
 
@@ -11,19 +94,14 @@ def create_user(db: Session, user: UserCreate):
         user (UserCreate): Schema containing user data to create.
 
     Returns:
-        User: The created user object.
+        User: The created user object, or None if the username or email is already taken.
 
     Raises:
-        Exception: If database operations fail (e.g., integrity errors).
+        Exception: If database operations fail (e.g., integrity errors other than duplicates).
     """
     # Hash the user's password for security
     hashed_password = get_password_hash(user.password)
-    # Create a new user instance with hashed password
-    db_user = User(username=user.username, email=user.email, hashed_password=hashed_password)
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
-    return db_user
+    return insert_user(db, user.username, user.email, hashed_password)
 
 def get_user_by_username(db: Session, username: str):
     """Retrieves a user by their username.
@@ -0,0 +1,96 @@
+"""Measures user registrations per second through the CRUD layer.
+
+Usage:
+    BENCH_DATABASE_URL=sqlite:// python -m benchmarks.register [count]
+
+The benchmark builds its own engine from BENCH_DATABASE_URL (an in-memory
+SQLite database by default) and never touches the app's DATABASE_URL,
+because it drops and recreates the users and posts tables. Point it only
+at a throwaway database.
+
+The password is hashed once up front, so the timings cover the database
+path only. Every other registration reuses an existing username, so both
+the insert path and the conflict path are exercised. The old flow (lookup,
+then add/commit/refresh) is timed first as a baseline.
+"""
+import os
+import sys
+import time
+
+# app.database builds its engine at import time; it is never used here
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.database import Base
+from app.crud.user import get_user_by_username, insert_user
+from app.dependencies.auth import get_password_hash
+from app.models.user import User
+import app.models.post  # noqa: F401 (registers the posts table)
+
+BENCH_DATABASE_URL = os.getenv("BENCH_DATABASE_URL", "sqlite://")
+
+def lookup_then_insert(db, username: str, email: str, hashed_password: str):
+    """Registers a user the old way: SELECT, then INSERT, commit and refresh.
+
+    Args:
+        db (Session): Database session for transaction management.
+        username (str): The username of the new user.
+        email (str): The email address of the new user.
+        hashed_password (str): The hashed password of the new user.
+
+    Returns:
+        User: The created user object, or None if the username is already taken.
+    """
+    # Check the username first, as register_user used to
+    if get_user_by_username(db, username):
+        return None
+    db_user = User(username=username, email=email, hashed_password=hashed_password)
+    db.add(db_user)
+    db.commit()
+    db.refresh(db_user)
+    return db_user
+
+def run(label: str, register, session_factory, engine, count: int, hashed_password: str):
+    """Times `count` registration attempts on freshly created tables.
+
+    Args:
+        label (str): Name printed next to the result.
+        register (Callable): Function called as register(db, username, email, hashed_password).
+        session_factory (sessionmaker): Factory for the benchmark database sessions.
+        engine (Engine): Engine of the benchmark database.
+        count (int): Number of registration attempts.
+        hashed_password (str): Precomputed password hash shared by all attempts.
+    """
+    # Start from empty tables so every run is comparable
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    db = session_factory()
+    created = 0
+    start = time.perf_counter()
+    try:
+        for i in range(count):
+            # Odd attempts collide with the previous username
+            name = f"user{i - i % 2}"
+            if register(db, name, f"{name}-{i}@example.com", hashed_password) is not None:
+                created += 1
+    finally:
+        db.close()
+    elapsed = time.perf_counter() - start
+    print(f"{label}: {count} attempts ({created} created, {count - created} conflicts) "
+          f"in {elapsed:.2f}s, {count / elapsed:.1f} registrations/sec")
+
+def main(count: int = 2000):
+    """Prints registrations/sec for the old flow and for insert_user.
+
+    Args:
+        count (int, optional): Number of registration attempts per run. Defaults to 2000.
+    """
+    engine = create_engine(BENCH_DATABASE_URL)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    hashed_password = get_password_hash("secret")
+    run("lookup + add/commit/refresh", lookup_then_insert, session_factory, engine, count, hashed_password)
+    run("insert_user", insert_user, session_factory, engine, count, hashed_password)
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
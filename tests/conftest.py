@@ -0,0 +1,50 @@
+import os
+
+# app.database builds its engine at import time; tests use their own below
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.database import Base, get_db
+from app.main import app
+
+@pytest.fixture
+def engine():
+    """Provides a fresh in-memory SQLite database with all tables created."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture
+def no_returning(engine, monkeypatch):
+    """Makes the database behave like a build without INSERT ... RETURNING."""
+    monkeypatch.setattr(engine.dialect, "insert_returning", False)
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@pytest.fixture
+def db(session_factory):
+    db = session_factory()
+    yield db
+    db.close()
+
+@pytest.fixture
+def client(session_factory):
+    """Provides a test client whose requests use the test database."""
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
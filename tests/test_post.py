@@ -0,0 +1,25 @@
+import pytest
+
+@pytest.fixture
+def auth_headers(client):
+    """Registers a user and returns headers carrying their access token."""
+    client.post("/users/register", json={"username": "alice", "email": "alice@example.com", "password": "secret"})
+    response = client.post("/users/login", data={"username": "alice", "password": "secret"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+def create_and_check_post(client, auth_headers):
+    response = client.post("/posts/", json={"title": "Hello", "content": "World"}, headers=auth_headers)
+    assert response.status_code == 200
+    post = response.json()
+    assert post["id"] == 1
+    assert post["author_id"] == 1
+    assert post["created_at"]
+    assert (post["title"], post["content"]) == ("Hello", "World")
+    assert client.get("/posts/1").json() == post
+
+def test_create_post(client, auth_headers):
+    create_and_check_post(client, auth_headers)
+
+@pytest.mark.usefixtures("no_returning")
+def test_create_post_without_returning(client, auth_headers):
+    create_and_check_post(client, auth_headers)
@@ -0,0 +1,42 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from app.crud.user import insert_user
+
+def register(client, username, email):
+    return client.post("/users/register", json={"username": username, "email": email, "password": "secret"})
+
+def test_register_user(client):
+    response = register(client, "alice", "alice@example.com")
+    assert response.status_code == 200
+    assert response.json() == {"id": 1, "username": "alice", "email": "alice@example.com"}
+
+def test_register_duplicate_username(client):
+    register(client, "alice", "alice@example.com")
+    response = register(client, "alice", "other@example.com")
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Username or email already registered"}
+
+def test_register_duplicate_email(client):
+    register(client, "alice", "alice@example.com")
+    response = register(client, "bob", "alice@example.com")
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Username or email already registered"}
+
+@pytest.mark.usefixtures("no_returning")
+def test_insert_user_without_returning(db):
+    user = insert_user(db, "alice", "alice@example.com", "hash")
+    assert (user.id, user.username, user.email) == (1, "alice", "alice@example.com")
+    assert insert_user(db, "alice", "other@example.com", "hash") is None
+    assert insert_user(db, "bob", "alice@example.com", "hash") is None
+    assert insert_user(db, "bob", "bob@example.com", "hash").id == 2
+
+@pytest.mark.usefixtures("no_returning")
+def test_insert_user_without_returning_reraises_other_errors(db):
+    # A trigger failure is an IntegrityError that is not a duplicate username/email
+    db.execute(text(
+        "CREATE TRIGGER reject_user BEFORE INSERT ON users "
+        "BEGIN SELECT RAISE(ABORT, 'rejected by trigger'); END"
+    ))
+    with pytest.raises(IntegrityError, match="rejected by trigger"):
+        insert_user(db, "alice", "alice@example.com", "hash")